@@ -24,22 +24,31 @@ __all__ = ('Clock',)
 
 
 class Clock:
+    __slots__ = ('_ticks', '_resolution', '_inv_resolution', '_time')
+
     def __init__(self, start_time=0.0, resolution=1e-6):
         if resolution <= 0.0:
             raise ValueError('Resolution must be positive')
         self._ticks = round(start_time / resolution)
         self._resolution = resolution
+        # Multiplication is cheaper than division in advance()
+        self._inv_resolution = 1.0 / resolution
+        # time() is called by asyncio on every loop iteration, so cache the
+        # product rather than recomputing it per call.
+        self._time = self._ticks * self._resolution
 
     @property
     def resolution(self):
         return self._resolution
 
     def time(self):
-        return self._ticks * self._resolution
+        return self._time
 
     def advance(self, delta):
-        ticks = round(delta / self._resolution)
+        ticks = round(delta * self._inv_resolution)
         if ticks == 0 and delta != 0.0:
             warnings.warn('delta is less than resolution, so clock will not advance',
                           exceptions.ResolutionWarning)
-        self._ticks += ticks
+        if ticks:
+            self._ticks += ticks
+            self._time = self._ticks * self._resolution
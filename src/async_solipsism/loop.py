@@ -17,7 +17,6 @@
 
 import asyncio
 import concurrent.futures
-import subprocess
 import threading
 
 from . import selector, socket as _socket
@@ -26,42 +25,50 @@ from .exceptions import SolipsismError
 
 __all__ = ('EventLoop', 'EventLoopPolicy', 'aiohappyeyeballs_start_connection', 'stream_pairs')
 
+# Module-level alias: avoids re-resolving the module attribute on every call
+# to call_soon_threadsafe.
+_get_ident = threading.get_ident
+
 
 class EventLoop(asyncio.selector_events.BaseSelectorEventLoop):
     def __init__(self):
         super().__init__(selector=selector.Selector())
-        self._selector = selector.Selector()
         self._clock_resolution = self._selector.clock.resolution
-        # Map from (host, port) pair to ListenSocket
+        # Bound method, cached because asyncio calls time() on every
+        # iteration. It also keeps time() usable after the loop is closed.
+        self.__clock_time = self._selector.clock.time
+        # Map from (host, port) pair to ListenSocket. The flowinfo/scopeid
+        # elements of the sockaddr are deliberately not part of the key:
+        # a 2-tuple is cheaper to build and hash on every connect/accept.
         self.__listening_sockets = {}
         self.__next_port = 1
+        self.__next_listen_port = 60000
 
     def time(self):
-        return self._selector.clock.time()
+        return self.__clock_time()
 
     def call_soon_threadsafe(self, callback, *args, context=None):
-        if self._thread_id == threading.get_ident():
+        if self._thread_id == _get_ident():
             return self.call_soon(callback, *args, context=context)
         raise SolipsismError("call_soon_threadsafe is not supported")
 
     async def run_in_executor(self, executor, func, *args):
         # Mostly copies the base class code, but runs synchronously
-        self._check_closed()
+        if self._closed:
+            raise RuntimeError('Event loop is closed')
         if self._debug:
             self._check_callback(func, 'run_in_executor')
         if executor is None:
-            executor = self._default_executor
-            if executor is None:
-                executor = concurrent.futures.ThreadPoolExecutor()
-                self._default_executor = executor
+            executor = self._default_executor or self._make_default_executor()
         return executor.submit(func, *args).result()
 
-    async def getaddrinfo(self, host, port, *,
-                          family=0, type=0, proto=0, flags=0):
-        raise SolipsismError("getaddrinfo is not supported")
-
-    async def getnameinfo(self, sockaddr, flags=0):
-        raise SolipsismError("getnameinfo is not supported")
+    def _make_default_executor(self):
+        # Cold path: first run_in_executor call without an explicit executor.
+        # Created lazily so that loops which never offload don't pay for a
+        # thread pool.
+        executor = concurrent.futures.ThreadPoolExecutor()
+        self._default_executor = executor
+        return executor
 
     async def create_connection(
             self, protocol_factory, host=None, port=None,
@@ -71,9 +78,8 @@ class EventLoop(asyncio.selector_events.BaseSelectorEventLoop):
         if sock is None:
             if host is None and port is None:
                 raise ValueError('host and port was not specified and no sock specified')
-            addr = (host, port, 0, 0)
             try:
-                listener = self.__listening_sockets[addr]
+                listener = self.__listening_sockets[host, port]
             except KeyError:
                 raise ConnectionRefusedError(f'No socket listening on {host}:{port}') from None
             port = self.__next_port
@@ -84,19 +90,6 @@ class EventLoop(asyncio.selector_events.BaseSelectorEventLoop):
             ssl=ssl, sock=sock, **kwargs
         )
 
-    async def start_tls(self, transport, protocol, sslcontext, *,
-                        server_side=False,
-                        server_hostname=None,
-                        ssl_handshake_timeout=None):
-        raise SolipsismError("start_tls is not supported")
-
-    async def create_datagram_endpoint(self, protocol_factory,
-                                       local_addr=None, remote_addr=None, *,
-                                       family=0, proto=0, flags=0,
-                                       reuse_address=None, reuse_port=None,
-                                       allow_broadcast=None, sock=None):
-        raise SolipsismError("create_datagram_endpoint is not supported")
-
     async def create_server(
             self, protocol_factory, host=None, port=None,
             *,
@@ -115,15 +108,18 @@ class EventLoop(asyncio.selector_events.BaseSelectorEventLoop):
             sock = _socket.ListenSocket(addr)
         addr = sock.getsockname()
         if addr[1] == 0:  # Port 0: pick a free port
-            addr_list = list(addr)
-            addr_list[1] = 60000
-            while tuple(addr_list) in self.__listening_sockets:
-                addr_list[1] += 1
-            addr = tuple(addr_list)
+            port = self.__next_listen_port
+            # The counter makes this O(1); the loop only matters if the user
+            # explicitly bound a port in the 60000+ range.
+            while (addr[0], port) in self.__listening_sockets:
+                port += 1
+            self.__next_listen_port = port + 1
+            addr = (addr[0], port) + addr[2:]
             sock._sockname = addr
-        if addr in self.__listening_sockets:
+        key = addr[:2]
+        if key in self.__listening_sockets:
             raise SolipsismError("Reuse of listening addresses is not supported")
-        self.__listening_sockets[addr] = sock
+        self.__listening_sockets[key] = sock
         return await super().create_server(
             protocol_factory, None, None,
             sock=sock,
@@ -139,11 +135,12 @@ class EventLoop(asyncio.selector_events.BaseSelectorEventLoop):
                                                 local_addr_infos=None,
                                                 happy_eyeballs_delay=None,
                                                 interleave=None):
+        listening_sockets = self.__listening_sockets
+        normalise = _socket._normalise_ipv6_sockaddr
         for addr_info in addr_infos:
-            addr = addr_info[4]
-            addr = _socket._normalise_ipv6_sockaddr(addr)
-            if addr in self.__listening_sockets:
-                listener = self.__listening_sockets[addr]
+            addr = normalise(addr_info[4])
+            listener = listening_sockets.get(addr[:2])
+            if listener is not None:
                 if local_addr_infos:
                     local_addr_info = local_addr_infos[0]
                 else:
@@ -154,56 +151,6 @@ class EventLoop(asyncio.selector_events.BaseSelectorEventLoop):
                 return sock
         raise ConnectionRefusedError('No socket listening on requested addresses')
 
-    async def connect_read_pipe(self, protocol_factory, pipe):
-        raise SolipsismError("connect_read_pipe is not supported")
-
-    async def connect_write_pipe(self, protocol_factory, pipe):
-        raise SolipsismError("connect_write_pipe is not supported")
-
-    async def subprocess_shell(self, protocol_factory, cmd, *,
-                               stdin=subprocess.PIPE,
-                               stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE,
-                               universal_newlines=False,
-                               shell=True, bufsize=0,
-                               encoding=None, errors=None, text=None,
-                               **kwargs):
-        raise SolipsismError("subprocess_shell is not supported")
-
-    async def subprocess_exec(self, protocol_factory, program, *args,
-                              stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                              stderr=subprocess.PIPE, universal_newlines=False,
-                              shell=False, bufsize=0,
-                              encoding=None, errors=None, text=None,
-                              **kwargs):
-        raise SolipsismError("subprocess_exec is not supported")
-
-    async def sock_connect(self, sock, address):
-        raise SolipsismError("sock_connect is not supported")
-
-    async def sock_accept(self, sock):
-        raise SolipsismError("sock_accept is not supported")
-
-    def add_signal_handler(self, sig, callback, *args):
-        raise SolipsismError("add_signal_handler is not supported")
-
-    def remove_signal_handler(self, sig):
-        raise SolipsismError("remove_signal_handler is not supported")
-
-    async def create_unix_connection(
-            self, protocol_factory, path=None, *,
-            ssl=None, sock=None,
-            server_hostname=None,
-            ssl_handshake_timeout=None):
-        raise SolipsismError("create_unix_connection is not supported")
-
-    async def create_unix_server(
-            self, protocol_factory, path=None, *,
-            sock=None, backlog=100, ssl=None,
-            ssl_handshake_timeout=None,
-            start_serving=True):
-        raise SolipsismError("create_unix_server is not supported")
-
     # Methods in base class that we need to implement/override
 
     def _make_self_pipe(self):
@@ -214,10 +161,63 @@ class EventLoop(asyncio.selector_events.BaseSelectorEventLoop):
 
     def _stop_serving(self, sock):
         addr = sock.getsockname()
-        self.__listening_sockets.pop(addr)
+        self.__listening_sockets.pop(addr[:2])
         super()._stop_serving(sock)
 
 
+# Coroutine methods that exist only to raise SolipsismError. Generating them
+# from a factory keeps the class body focused on the methods that do real work.
+_UNSUPPORTED_ASYNC = (
+    'getaddrinfo',
+    'getnameinfo',
+    'start_tls',
+    'create_datagram_endpoint',
+    'connect_read_pipe',
+    'connect_write_pipe',
+    'subprocess_shell',
+    'subprocess_exec',
+    'sock_connect',
+    'sock_accept',
+    'create_unix_connection',
+    'create_unix_server',
+)
+
+
+_UNSUPPORTED_SYNC = (
+    'add_signal_handler',
+    'remove_signal_handler',
+)
+
+
+def _make_unsupported_async(name):
+    message = f"{name} is not supported"
+
+    async def stub(self, *args, **kwargs):
+        raise SolipsismError(message)
+
+    stub.__name__ = name
+    stub.__qualname__ = f'EventLoop.{name}'
+    return stub
+
+
+def _make_unsupported_sync(name):
+    message = f"{name} is not supported"
+
+    def stub(self, *args, **kwargs):
+        raise SolipsismError(message)
+
+    stub.__name__ = name
+    stub.__qualname__ = f'EventLoop.{name}'
+    return stub
+
+
+for _name in _UNSUPPORTED_ASYNC:
+    setattr(EventLoop, _name, _make_unsupported_async(_name))
+for _name in _UNSUPPORTED_SYNC:
+    setattr(EventLoop, _name, _make_unsupported_sync(_name))
+del _name
+
+
 class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
     def new_event_loop(self) -> EventLoop:
         return EventLoop()
@@ -225,8 +225,12 @@ class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
 
 async def stream_pairs(capacity=None):
     sock1, sock2 = _socket.socketpair(capacity=capacity)
-    streams1 = await asyncio.open_connection(sock=sock1)
-    streams2 = await asyncio.open_connection(sock=sock2)
+    # Both sockets are already connected, so the two opens can proceed
+    # concurrently rather than paying two scheduler round-trips.
+    streams1, streams2 = await asyncio.gather(
+        asyncio.open_connection(sock=sock1),
+        asyncio.open_connection(sock=sock2)
+    )
     return streams1, streams2
 
 
@@ -25,39 +25,76 @@ from .clock import Clock
 
 __all__ = ('Selector',)
 
+# Hoisted to module level: select() runs once per event-loop iteration.
+_MAX_SELECT_TIMEOUT = asyncio.base_events.MAXIMUM_SELECT_TIMEOUT
+_EVENT_READ = selectors.EVENT_READ
+_EVENT_WRITE = selectors.EVENT_WRITE
+
 
 class Selector(selectors._BaseSelectorImpl):
     def __init__(self, clock=None):
         super().__init__()
         self.clock = Clock() if clock is None else clock
+        self._advance = self.clock.advance
         self._closed = False
+        # Cached [(key, socket)] pairs for select(), rebuilt lazily after
+        # any registration change. select() runs every loop iteration, so
+        # it should not reconstruct dict views or chase key.fd.socket.
+        self._key_cache = None
 
     def _fileobj_lookup(self, fileobj):
         self._check_closed()
-        if isinstance(fileobj, socket.Socket):
-            return fileobj.fileno()
-        elif isinstance(fileobj, socket.SocketFd):
+        # Exact type checks: these are internal classes that are never
+        # subclassed, and a pointer comparison is cheaper than isinstance
+        # on a lookup that runs for every register/unregister.
+        t = type(fileobj)
+        if t is socket.SocketFd:
             return fileobj
+        elif t is socket.Socket:
+            return fileobj.fileno()
         else:
             raise SolipsismError('Only instances of Socket or SocketFd can be registered')
 
+    def register(self, fileobj, events, data=None):
+        self._key_cache = None
+        return super().register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        self._key_cache = None
+        return super().unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        self._key_cache = None
+        return super().modify(fileobj, events, data)
+
     def select(self, timeout=None):
         self._check_closed()
+        keys = self._key_cache
+        if keys is None:
+            keys = self._key_cache = [(key, key.fd.socket) for key in self._fd_to_key.values()]
+        if not keys:
+            # Nothing registered: go straight to the timeout handling.
+            if timeout is None or timeout >= _MAX_SELECT_TIMEOUT:
+                raise SleepForeverError('select with no timeout and no ready events')
+            elif timeout > 0:
+                self._advance(timeout)
+            return []
         ready = []
-        for key in self.get_map().values():
+        for key, sock in keys:
+            interest = key.events
             events = 0
-            if (key.events & selectors.EVENT_READ) and key.fd.socket.read_ready():
-                events |= selectors.EVENT_READ
-            if (key.events & selectors.EVENT_WRITE) and key.fd.socket.write_ready():
-                events |= selectors.EVENT_WRITE
+            if (interest & _EVENT_READ) and sock.read_ready():
+                events = _EVENT_READ
+            if (interest & _EVENT_WRITE) and sock.write_ready():
+                events |= _EVENT_WRITE
             if events:
                 ready.append((key, events))
         if ready:
             return ready
-        elif timeout is None or timeout >= asyncio.base_events.MAXIMUM_SELECT_TIMEOUT:
+        elif timeout is None or timeout >= _MAX_SELECT_TIMEOUT:
             raise SleepForeverError('select with no timeout and no ready events')
         elif timeout > 0:
-            self.clock.advance(timeout)
+            self._advance(timeout)
         return []
 
     def close(self):
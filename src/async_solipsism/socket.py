@@ -36,70 +36,138 @@ def _view(bytes):
 
 
 class Queue:
+    __slots__ = ('capacity', '_buffer', '_head', '_size', '_eof')
+
     def __init__(self, capacity=None):
         self.capacity = capacity or DEFAULT_CAPACITY
-        self._buffer = bytearray()
+        # Fixed-size circular buffer: _head is the read position and _size
+        # the number of buffered bytes. Reads and writes are bounded copies
+        # (split in two where they wrap) with no reallocation, so the
+        # buffer's steady-state cost is independent of how much data has
+        # flowed through it.
+        self._buffer = bytearray(self.capacity)
+        self._head = 0
+        self._size = 0
         self._eof = False
 
     def write_eof(self):
         self._eof = True
 
     def __len__(self):
-        return len(self._buffer)
+        return self._size
 
     def __bool__(self):
-        return bool(self._buffer)
+        return bool(self._size)
 
     def write(self, data):
         if self._eof:
             raise BrokenPipeError(errno.EPIPE, 'Broken pipe')
-        if len(self) >= self.capacity:
+        free = self.capacity - self._size
+        if free <= 0:
             return None
+        tail = self._head + self._size
+        if tail >= self.capacity:
+            tail -= self.capacity
+        if type(data) is bytes:
+            # Fast path for the overwhelmingly common case: flat bytes that
+            # fit without wrapping need no memoryview or slicing at all.
+            n = len(data)
+            if n <= free and n <= self.capacity - tail:
+                self._buffer[tail:tail + n] = data
+                self._size += n
+                return n
         with _view(data) as view:
-            n = len(view)
-            if len(self) + n > self.capacity:
-                n = self.capacity - len(self)
-                with view[:n] as prefix:
-                    self._buffer += prefix
-            else:
-                self._buffer += view
+            n = min(len(view), free)
+            first = min(n, self.capacity - tail)
+            self._buffer[tail:tail + first] = view[:first]
+            if first < n:
+                self._buffer[:n - first] = view[first:n]
+        self._size += n
         return n
 
     def read(self, size=-1):
-        if not self._buffer:
+        if not self._size:
             if self._eof:
                 return b''
             else:
                 raise BlockingIOError
-        elif size < 0:
-            ret = self._buffer
-            self._buffer = bytearray()
-        else:
-            n = min(size, len(self._buffer))
-            with memoryview(self._buffer) as view, view[:n] as prefix:
-                ret = bytes(prefix)
-            self._buffer = self._buffer[n:]
+        n = self._size if size < 0 else min(size, self._size)
+        head = self._head
+        first = min(n, self.capacity - head)
+        with memoryview(self._buffer) as view:
+            if first == n:
+                ret = bytes(view[head:head + n])
+            else:
+                ret = bytes(view[head:]) + bytes(view[:n - first])
+        self._size -= n
+        # Rewind to the start when drained: later writes then take the
+        # contiguous path instead of splitting around the wrap point.
+        self._head = 0 if not self._size else (head + n) % self.capacity
         return ret
 
+    def readinto(self, buffer):
+        """Read directly into a caller-provided buffer.
+
+        Unlike :meth:`read` this performs a single copy, with no
+        intermediate :class:`bytes` object.
+        """
+        with _view(buffer) as view:
+            if not self._size:
+                if self._eof:
+                    return 0
+                else:
+                    raise BlockingIOError
+            n = min(len(view), self._size)
+            head = self._head
+            first = min(n, self.capacity - head)
+            with memoryview(self._buffer) as src:
+                view[:first] = src[head:head + first]
+                if first < n:
+                    view[first:n] = src[:n - first]
+        self._size -= n
+        # As in read(): rewind when drained so writes stay contiguous.
+        self._head = 0 if not self._size else (head + n) % self.capacity
+        return n
+
     def read_ready(self):
-        return self._eof or self._buffer
+        return self._eof or bool(self._size)
 
     def write_ready(self):
-        return self._eof or len(self) < self.capacity
+        return self._eof or self._size < self.capacity
+
+
+# Shutdown flags affecting each direction, built once rather than per call
+# (close() goes through shutdown for every connection torn down).
+_SHUT_READ = frozenset({socket.SHUT_RD, socket.SHUT_RDWR})
+_SHUT_WRITE = frozenset({socket.SHUT_WR, socket.SHUT_RDWR})
+
+# Socket options that are accepted (and ignored) without a warning. Built
+# once: setsockopt is called several times per connection setup.
+_SILENT_SOCKOPTS = frozenset({
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY),
+    (socket.SOL_SOCKET, socket.SO_REUSEADDR),
+    (socket.SOL_SOCKET, socket.SO_REUSEPORT),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+})
 
 
 class SocketFd:
+    __slots__ = ('socket', '_hash')
+
     def __init__(self, socket):
         self.socket = socket
+        # Cached: the selector hashes fds on every register/lookup, and
+        # equality is identity of the socket anyway.
+        self._hash = id(socket)
 
     def fileno(self):
         return self
 
     def __int__(self):
-        return id(self.socket)
+        return self._hash
 
     def __hash__(self):
-        return hash(self.socket)
+        return self._hash
 
     def __eq__(self, other):
         if type(other) is SocketFd:
@@ -108,12 +176,23 @@ class SocketFd:
 
 
 class _SocketBase:
+    __slots__ = ('_fd',)
+
     family = socket.AF_INET6
     type = socket.SOCK_STREAM
     proto = 0
 
+    def __init__(self):
+        self._fd = None
+
     def fileno(self):
-        return SocketFd(self)
+        # Cached: asyncio calls fileno() repeatedly while setting up and
+        # tearing down transports, and the fd's identity must only depend
+        # on the socket.
+        fd = self._fd
+        if fd is None:
+            fd = self._fd = SocketFd(self)
+        return fd
 
     def gettimeout(self):
         return 0.0
@@ -123,23 +202,22 @@ class _SocketBase:
             raise SolipsismError('Socket only supports non-blocking operation')
 
     def setsockopt(self, level, optname, value, optlen=None):
-        key = (level, optname)
-        if key not in {
-            (socket.IPPROTO_TCP, socket.TCP_NODELAY),
-            (socket.SOL_SOCKET, socket.SO_REUSEADDR),
-            (socket.SOL_SOCKET, socket.SO_REUSEPORT),
-            (socket.SOL_SOCKET, socket.SO_KEEPALIVE)
-        }:
+        if (level, optname) not in _SILENT_SOCKOPTS:
             warnings.warn(
                 f'Ignoring socket option {level}:{optname}', SolipsismWarning, stacklevel=2
             )
         # TODO: implement SO_RCVBUF/SO_SNDBUF to change the queue capacity.
 
 
+# Default result of _normalise_ipv6_sockaddr, shared rather than rebuilt:
+# socketpair() normalises up to four unnamed addresses per call.
+_WILDCARD_SOCKADDR = ('::', 0, 0, 0)
+
+
 def _normalise_ipv6_sockaddr(addr):
     """Convert a socket address to a :meth:`socket.socket.getsockname` result for IPv6."""
     if addr is None:
-        return ('::', 0, 0, 0)
+        return _WILDCARD_SOCKADDR
     # The flow-id and scope are optional
     if not isinstance(addr, tuple) or len(addr) < 2 or len(addr) > 4:
         raise TypeError('AF_INET6 address must be a tuple (host, port[, flowinfo[, scopeid]])')
@@ -149,7 +227,10 @@ def _normalise_ipv6_sockaddr(addr):
 class Socket(_SocketBase):
     """Emulate a connected TCP socket."""
 
+    __slots__ = ('_read_queue', '_write_queue', '_sockname', '_peername')
+
     def __init__(self, read_queue, write_queue, sockname=None, peername=None):
+        super().__init__()
         self._read_queue = read_queue
         self._write_queue = write_queue
         self._sockname = _normalise_ipv6_sockaddr(sockname)
@@ -172,7 +253,7 @@ class Socket(_SocketBase):
         return self._read_queue.read(bufsize)
 
     def recv_into(self, buffer, nbytes=0, flags=0):
-        # TODO: implement more efficiently?
+        self._check_closed()
         with _view(buffer) as view:
             if not nbytes:
                 nbytes = len(view)
@@ -180,25 +261,28 @@ class Socket(_SocketBase):
                 raise ValueError("negative buffersize in recv_into")
             if nbytes > len(view):
                 raise ValueError("buffer too small for requested bytes")
-            data = self.recv(nbytes)
-            view[:len(data)] = data
-            return len(data)
+            with view[:nbytes] as dest:
+                return self._read_queue.readinto(dest)
 
     def send(self, bytes, flags=0):
         self._check_closed()
         return self._write_queue.write(bytes)
 
     def read_ready(self):
-        return self._read_queue is None or self._read_queue.read_ready()
+        # Inlines Queue.read_ready: the selector polls this every iteration.
+        q = self._read_queue
+        return q is None or q._eof or bool(q._size)
 
     def write_ready(self):
-        return self._write_queue is None or self._write_queue.write_ready()
+        # Inlines Queue.write_ready, as for read_ready above.
+        q = self._write_queue
+        return q is None or q._eof or q._size < q.capacity
 
     def shutdown(self, flag):
         self._check_closed()
-        if flag in {socket.SHUT_RD, socket.SHUT_RDWR} and self._read_queue is not None:
+        if flag in _SHUT_READ and self._read_queue is not None:
             self._read_queue.write_eof()
-        if flag in {socket.SHUT_WR, socket.SHUT_RDWR} and self._write_queue is not None:
+        if flag in _SHUT_WRITE and self._write_queue is not None:
             self._write_queue.write_eof()
 
     def close(self):
@@ -210,7 +294,10 @@ class Socket(_SocketBase):
 class ListenSocket(_SocketBase):
     """Emulate a TCP socket that is listening for incoming connections."""
 
+    __slots__ = ('_sockname', '_queue')
+
     def __init__(self, sockname):
+        super().__init__()
         self._sockname = _normalise_ipv6_sockaddr(sockname)
         self._queue = deque()
 
@@ -221,11 +308,7 @@ class ListenSocket(_SocketBase):
         pass
 
     def read_ready(self):
-        if self._queue is None:
-            return True
-        while self._queue and self._queue[0][0].done():
-            self._queue.popleft()
-        return bool(self._queue)
+        return self._queue is None or bool(self._queue)
 
     def close(self):
         for waiter, peername in self._queue:
@@ -236,18 +319,29 @@ class ListenSocket(_SocketBase):
     def accept(self):
         if self._queue is None:
             raise RuntimeError('Socket is already closed')
-        while self._queue and self._queue[0][0].done():
-            self._queue.popleft()
-        if not self._queue:
-            raise BlockingIOError
-        socks = socketpair(sock1_name=self._queue[0][1], sock2_name=self._sockname)
-        waiter, peername = self._queue.popleft()
-        waiter.set_result(socks[0])
-        return socks[1], peername
+        while self._queue:
+            waiter, peername = self._queue.popleft()
+            # A cancelled waiter can still be present if its done callback
+            # hasn't run yet.
+            if not waiter.done():
+                socks = socketpair(sock1_name=peername, sock2_name=self._sockname)
+                waiter.set_result(socks[0])
+                return socks[1], peername
+        raise BlockingIOError
+
+    def _waiter_done(self, waiter):
+        # Remove abandoned connection attempts when they are cancelled,
+        # rather than scanning for them every time read_ready is polled.
+        if waiter.cancelled() and self._queue is not None:
+            for entry in self._queue:
+                if entry[0] is waiter:
+                    self._queue.remove(entry)
+                    break
 
     async def make_connection(self, peername):
         """Connect to the server represented by this listening socket."""
         waiter = asyncio.get_event_loop().create_future()
+        waiter.add_done_callback(self._waiter_done)
         self._queue.append((waiter, peername))
         return await waiter
 